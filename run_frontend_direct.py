@@ -8,7 +8,6 @@ This script starts a simple HTTP server to serve the frontend files.
 import os
 import sys
 import http.server
-import socketserver
 import socket
 from pathlib import Path
 
@@ -17,8 +16,15 @@ DEFAULT_PORT = 8080
 
 def is_port_in_use(port):
     """Check if a port is in use."""
+    # Try to bind rather than connect: no handshake per probe, and it
+    # tests the capability we actually need (can the server bind here?)
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(("", port))
+            return False
+        except OSError:
+            return True
 
 def find_available_port(start_port=DEFAULT_PORT, max_attempts=10):
     """Find an available port starting from start_port."""
@@ -45,11 +51,13 @@ def main():
     # Change to the frontend directory
     os.chdir(frontend_dir)
     
-    # Set up the HTTP server
+    # Set up the HTTP server. ThreadingHTTPServer handles each request on
+    # its own thread, so a browser fetching many assets in parallel is no
+    # longer serialized behind one blocking file read at a time.
     handler = http.server.SimpleHTTPRequestHandler
     
     # Create and start the server
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
         print(f"Frontend server started at http://localhost:{port}")
         print(f"Serving files from: {frontend_dir}")
         try:
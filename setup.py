@@ -24,31 +24,49 @@ except FileNotFoundError:
 # Detect if we're on x86 architecture to enable SSE/AVX optimizations
 is_x86 = platform.machine().lower() in ['x86_64', 'amd64', 'i386', 'i686']
 
-# Optimization flags
-if is_x86:
-    # Enable SSE2/SSE4/AVX2 for x86 architectures
-    extra_compile_args = ['-O3', '-march=native', '-mtune=native']
-    if sys.platform != 'darwin':  # macOS has different compiler flags
-        extra_compile_args.extend(['-msse2', '-msse4', '-mavx2'])
+# Each extension is compiled once per ISA level instead of once with
+# -march=native: native tuning targets the build host, so wheels built on a
+# modern machine would crash with illegal instructions elsewhere, while a
+# lowest-common-denominator build leaves AVX performance on the table.
+# quantum_hash.core.load_extension() picks the best variant at runtime from
+# the CPU's feature flags. Suffix '' is the portable baseline.
+if is_x86 and sys.platform != 'darwin':
+    ISA_VARIANTS = [
+        ('', ['-msse2', '-msse4']),
+        ('_avx2', ['-mavx2']),
+        ('_avx512', ['-mavx512f', '-mavx512bw', '-mavx512vl']),
+    ]
 else:
-    # Generic optimizations for other architectures
-    extra_compile_args = ['-O3']
+    # Generic optimizations for other architectures / macOS
+    ISA_VARIANTS = [('', [])]
+
+
+def _isa_extensions(base_name, source):
+    """Build one Extension per ISA variant of a C module.
+
+    The module init symbol is renamed per variant through a preprocessor
+    define so each shared object exports the PyInit function matching its
+    own module name.
+    """
+    extensions = []
+    for suffix, isa_flags in ISA_VARIANTS:
+        macros = []
+        if suffix:
+            macros.append((f'PyInit_{base_name}',
+                           f'PyInit_{base_name}{suffix}'))
+        extensions.append(Extension(
+            f'quantum_hash.core.{base_name}{suffix}',
+            sources=[source],
+            extra_compile_args=['-O3'] + isa_flags,
+            extra_link_args=['-O3'],
+            define_macros=macros,
+        ))
+    return extensions
 
-# Define the C extension modules with relative paths
-optimized_core = Extension(
-    'quantum_hash.core.optimized_core',
-    sources=['src/quantum_hash/core/optimized_core.c'],
-    extra_compile_args=extra_compile_args,
-    extra_link_args=['-O3'],
-    include_dirs=[],
-)
 
-# Hybrid hash function extension
-hybrid_core = Extension(
-    'quantum_hash.core.hybrid_core',
-    sources=['src/quantum_hash/core/hybrid_core.c'],
-    extra_compile_args=extra_compile_args,
-    extra_link_args=['-O3'],
+ext_modules = (
+    _isa_extensions('optimized_core', 'src/quantum_hash/core/optimized_core.c')
+    + _isa_extensions('hybrid_core', 'src/quantum_hash/core/hybrid_core.c')
 )
 
 # Check for optional packages
@@ -90,7 +108,7 @@ setup(
     },
     include_package_data=True,
     install_requires=requirements,
-    ext_modules=[optimized_core, hybrid_core],  # Include both extensions
+    ext_modules=ext_modules,  # All ISA variants of both extensions
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
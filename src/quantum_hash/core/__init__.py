@@ -1 +1,52 @@
-"""Core quantum-inspired algorithms.""" 
\ No newline at end of file
+"""Core quantum-inspired algorithms."""
+
+import importlib
+
+# ISA variants built by setup.py, best first. Each suffix corresponds to a
+# sibling shared object compiled with the matching instruction-set flags;
+# the unsuffixed module is the portable baseline build.
+_ISA_VARIANTS = [
+    ('_avx512', {'avx512f', 'avx512bw', 'avx512vl'}),
+    ('_avx2', {'avx2'}),
+]
+
+
+def _cpu_flags():
+    """Return the CPU feature flags, or an empty set when undetectable."""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return set(line.split(':', 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def load_extension(base_name):
+    """Import the fastest available build of a C extension module.
+
+    A single build with aggressive flags would crash with illegal
+    instructions on CPUs older than the build host, so setup.py compiles
+    each extension several times at different ISA levels and this loader
+    picks the best variant the running CPU supports, falling back to the
+    portable baseline build.
+
+    Args:
+        base_name: Extension name without ISA suffix (e.g. 'optimized_core')
+
+    Returns:
+        The imported extension module
+
+    Raises:
+        ImportError: If no variant of the extension is importable
+    """
+    flags = _cpu_flags()
+    for suffix, required in _ISA_VARIANTS:
+        if required <= flags:
+            try:
+                return importlib.import_module(
+                    f'.{base_name}{suffix}', __name__)
+            except ImportError:
+                continue
+    return importlib.import_module(f'.{base_name}', __name__)
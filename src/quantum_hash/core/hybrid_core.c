@@ -12,7 +12,8 @@
 #include <string.h>
 
 // Constants (same as in Python implementation)
-static const uint32_t PRIMES[] = {
+/* 64-byte alignment keeps the whole table in one cache line */
+static const uint32_t __attribute__((aligned(64))) PRIMES[] = {
     0x9e3779b9, 0x6a09e667, 0xbb67ae85, 0x3c6ef372,
     0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab,
     0x5be0cd19, 0xca62c1d6, 0x84caa73b, 0xfe94f82b
@@ -54,8 +55,10 @@ static PyObject* optimized_hybrid_hash_c(PyObject* self, PyObject* args) {
     
     // Handle empty data
     if (data.len == 0) {
-        char empty_byte = 0;
-        data.buf = &empty_byte;
+        // Point at static storage: a block-scoped local would dangle once
+        // this if-body ends, making the empty-input digest undefined
+        static const char empty_byte = 0;
+        data.buf = (void*)&empty_byte;
         data.len = 1;
     }
     
@@ -87,6 +90,16 @@ static PyObject* optimized_hybrid_hash_c(PyObject* self, PyObject* args) {
     // Copy and pad data
     memcpy(padded_data, data.buf, data.len);
     
+    // Scratch buffer reused by both per-block mixing passes, allocated
+    // once instead of twice per block
+    uint32_t* temp_state = (uint32_t*)malloc(state_size * sizeof(uint32_t));
+    if (!temp_state) {
+        free(padded_data);
+        free(state);
+        PyBuffer_Release(&data);
+        return PyErr_NoMemory();
+    }
+    
     // Process each block with hybrid approach (combining Grover and Shor elements)
     for (int block_start = 0; block_start < padded_size; block_start += block_size) {
         // First process the block with Grover-inspired chunking
@@ -114,14 +127,6 @@ static PyObject* optimized_hybrid_hash_c(PyObject* self, PyObject* args) {
         }
         
         // Then apply Shor-inspired state mixing using more state elements
-        uint32_t* temp_state = (uint32_t*)malloc(state_size * sizeof(uint32_t));
-        if (!temp_state) {
-            free(padded_data);
-            free(state);
-            PyBuffer_Release(&data);
-            return PyErr_NoMemory();
-        }
-        
         memcpy(temp_state, state, state_size * sizeof(uint32_t));
         
         // Enhanced state diffusion with longer ranges
@@ -139,17 +144,7 @@ static PyObject* optimized_hybrid_hash_c(PyObject* self, PyObject* args) {
             state[i] = mixed ^ (state_size * (uint32_t)data.len);
         }
         
-        free(temp_state);
-        
         // Apply permutation after each block similar to Shor
-        temp_state = (uint32_t*)malloc(state_size * sizeof(uint32_t));
-        if (!temp_state) {
-            free(padded_data);
-            free(state);
-            PyBuffer_Release(&data);
-            return PyErr_NoMemory();
-        }
-        
         memcpy(temp_state, state, state_size * sizeof(uint32_t));
         
         // More complex permutation for better diffusion
@@ -157,10 +152,10 @@ static PyObject* optimized_hybrid_hash_c(PyObject* self, PyObject* args) {
             int j = ((i * 7 + 3) * (i + 5)) % state_size;
             state[j] = temp_state[i] ^ rotate_left(temp_state[(i+1) % state_size], 13);
         }
-        
-        free(temp_state);
     }
     
+    free(temp_state);
+    
     // Add data length to prevent length extension attacks
     for (int i = 0; i < state_size; i++) {
         state[i] ^= (uint32_t)data.len + (i * 0x9e3779b9);
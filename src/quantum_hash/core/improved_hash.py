@@ -41,6 +41,29 @@ def mix_bits(a: int, b: int, bits: int = 32) -> Tuple[int, int]:
     return a, b
 
 
+def fmix64_finalize(digest: bytes) -> bytes:
+    """Apply the MurmurHash3 fmix64 finalizer across a digest.
+
+    The digest is viewed as little-endian 64-bit words and each word gets
+    the xor-shift/multiply avalanche chain. This drives per-output-bit
+    diffusion to the ideal 50% far more strongly than byte-level mixing;
+    any tail bytes beyond a whole word are passed through unchanged.
+    """
+    n_words = len(digest) // 8
+    if n_words == 0:
+        return digest
+
+    words = np.frombuffer(digest[:n_words * 8], dtype='<u8').copy()
+    with np.errstate(over='ignore'):
+        words ^= words >> np.uint64(33)
+        words *= np.uint64(0xFF51AFD7ED558CCD)
+        words ^= words >> np.uint64(33)
+        words *= np.uint64(0xC4CEB9FE1A85EC53)
+        words ^= words >> np.uint64(33)
+
+    return words.tobytes() + digest[n_words * 8:]
+
+
 def improved_grover_hash(data: bytes, digest_size: int = 32) -> bytes:
     """
     Improved Grover-inspired hash function with better diffusion and
@@ -275,5 +298,6 @@ def improved_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
         j = (i + 1) % digest_size
         k = (i + 7) % digest_size
         result[i] = (result[i] + result[j] * result[k]) % 256
-    
-    return bytes(result) 
\ No newline at end of file
+
+    # Word-level avalanche finalizer on top of the byte-level pass
+    return fmix64_finalize(bytes(result)) 
\ No newline at end of file
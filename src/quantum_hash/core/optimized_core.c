@@ -11,7 +11,8 @@
 #include <string.h>
 
 // Constants (same as in Python implementation)
-static const uint32_t PRIMES[] = {
+/* 64-byte alignment keeps the whole table in one cache line */
+static const uint32_t __attribute__((aligned(64))) PRIMES[] = {
     0x9e3779b9, 0x6a09e667, 0xbb67ae85, 0x3c6ef372,
     0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab,
     0x5be0cd19, 0xca62c1d6, 0x84caa73b, 0xfe94f82b
@@ -51,8 +52,10 @@ static PyObject* optimized_grover_hash_c(PyObject* self, PyObject* args) {
     
     // Handle empty data
     if (data.len == 0) {
-        char empty_byte = 0;
-        data.buf = &empty_byte;
+        // Point at static storage: a block-scoped local would dangle once
+        // this if-body ends, making the empty-input digest undefined
+        static const char empty_byte = 0;
+        data.buf = (void*)&empty_byte;
         data.len = 1;
     }
     
@@ -80,41 +83,56 @@ static PyObject* optimized_grover_hash_c(PyObject* self, PyObject* args) {
     // Copy and pad data
     memcpy(padded_data, data.buf, data.len);
     
+    // Scratch buffers: temp_state for the per-chunk state diffusion,
+    // lane_a/lane_b for the mixing rounds. All allocated once up front
+    uint32_t* temp_state = (uint32_t*)malloc(3 * digest_size * sizeof(uint32_t));
+    if (!temp_state) {
+        free(padded_data);
+        free(state);
+        PyBuffer_Release(&data);
+        return PyErr_NoMemory();
+    }
+    uint32_t* lane_a = temp_state + digest_size;
+    uint32_t* lane_b = lane_a + digest_size;
+
     // Process each chunk
     for (int i = 0; i < padded_size; i += chunk_size) {
         uint32_t chunk = 0;
         for (int j = 0; j < chunk_size && (i + j) < padded_size; j++) {
             chunk |= ((uint32_t)padded_data[i + j]) << (j * 8);
         }
-        
+
         // Add additional data length to prevent length extension attacks
         if (i == padded_size - chunk_size) {
             chunk ^= (uint32_t)data.len;
         }
-        
-        // Enhanced mixing process
+
+        // Enhanced mixing process. The lanes are independent, so the
+        // rounds run as loops over whole lane arrays: each short loop is
+        // free of cross-iteration dependencies and auto-vectorizes, with
+        // the fixed-count rotates lowering to vector rotate instructions
+        // (vprold) on AVX-512 builds
         for (int s = 0; s < digest_size; s++) {
-            uint32_t a = state[s];
-            uint32_t b = chunk ^ PRIMES[s % 12];
-            
-            // Multiple mixing rounds for better diffusion
-            for (int r = 0; r < 3; r++) {
-                mix_bits(&a, &b);
-                b = rotate_left(b, ROTATIONS[r % 10]);
+            lane_a[s] = state[s];
+            lane_b[s] = chunk ^ PRIMES[s % 12];
+        }
+
+        // Multiple mixing rounds for better diffusion
+        for (int r = 0; r < 3; r++) {
+            for (int s = 0; s < digest_size; s++) {
+                mix_bits(&lane_a[s], &lane_b[s]);
+            }
+            uint8_t rot = ROTATIONS[r % 10];
+            for (int s = 0; s < digest_size; s++) {
+                lane_b[s] = rotate_left(lane_b[s], rot);
             }
-            
-            state[s] = a ^ b;
         }
-        
-        // State diffusion after each chunk (improved version)
-        uint32_t* temp_state = (uint32_t*)malloc(digest_size * sizeof(uint32_t));
-        if (!temp_state) {
-            free(padded_data);
-            free(state);
-            PyBuffer_Release(&data);
-            return PyErr_NoMemory();
+
+        for (int s = 0; s < digest_size; s++) {
+            state[s] = lane_a[s] ^ lane_b[s];
         }
         
+        // State diffusion after each chunk (improved version)
         memcpy(temp_state, state, digest_size * sizeof(uint32_t));
         
         for (int s = 0; s < digest_size; s++) {
@@ -122,10 +140,10 @@ static PyObject* optimized_grover_hash_c(PyObject* self, PyObject* args) {
             int k = (s + digest_size/2) % digest_size;
             state[s] = rotate_left(temp_state[s], 5) ^ temp_state[j] ^ rotate_left(temp_state[k], 13);
         }
-        
-        free(temp_state);
     }
     
+    free(temp_state);
+    
     // Final mixing rounds
     for (int r = 0; r < digest_size; r++) {
         int i = r % digest_size;
@@ -173,8 +191,10 @@ static PyObject* optimized_shor_hash_c(PyObject* self, PyObject* args) {
     
     // Handle empty data
     if (data.len == 0) {
-        char empty_byte = 0;
-        data.buf = &empty_byte;
+        // Point at static storage: a block-scoped local would dangle once
+        // this if-body ends, making the empty-input digest undefined
+        static const char empty_byte = 0;
+        data.buf = (void*)&empty_byte;
         data.len = 1;
     }
     
@@ -203,6 +223,16 @@ static PyObject* optimized_shor_hash_c(PyObject* self, PyObject* args) {
     // Copy and pad data
     memcpy(padded_data, data.buf, data.len);
     
+    // Scratch buffer for the per-block permutation, allocated once
+    // instead of per block
+    uint32_t* temp = (uint32_t*)malloc(state_size * sizeof(uint32_t));
+    if (!temp) {
+        free(padded_data);
+        free(state);
+        PyBuffer_Release(&data);
+        return PyErr_NoMemory();
+    }
+    
     // Enhanced processing with better quantum resistance
     for (int block_start = 0; block_start < padded_size; block_start += block_size) {
         for (int i = 0; i < block_size; i += 4) {
@@ -235,24 +265,16 @@ static PyObject* optimized_shor_hash_c(PyObject* self, PyObject* args) {
         }
         
         // Apply permutation after each block
-        uint32_t* temp = (uint32_t*)malloc(state_size * sizeof(uint32_t));
-        if (!temp) {
-            free(padded_data);
-            free(state);
-            PyBuffer_Release(&data);
-            return PyErr_NoMemory();
-        }
-        
         memcpy(temp, state, state_size * sizeof(uint32_t));
         
         for (int i = 0; i < state_size; i++) {
             int j = (i * 7 + 1) % state_size;
             state[j] = temp[i];
         }
-        
-        free(temp);
     }
     
+    free(temp);
+    
     // Finalization with data length to prevent length extension
     for (int i = 0; i < state_size; i++) {
         state[i] ^= (uint32_t)data.len;
@@ -10,10 +10,15 @@ from typing import List, Tuple, Optional, Union
 import hashlib
 import os
 
-# Try to import C extensions
+from .improved_hash import fmix64_finalize
+
+# Try to import C extensions, taking the best ISA variant this CPU supports
 try:
-    from .optimized_core import optimized_grover_hash_c, optimized_shor_hash_c
-    from .hybrid_core import optimized_hybrid_hash_c
+    from . import load_extension
+    _optimized_core = load_extension('optimized_core')
+    optimized_grover_hash_c = _optimized_core.optimized_grover_hash_c
+    optimized_shor_hash_c = _optimized_core.optimized_shor_hash_c
+    optimized_hybrid_hash_c = load_extension('hybrid_core').optimized_hybrid_hash_c
     _HAVE_C_EXTENSIONS = True
 except ImportError:
     _HAVE_C_EXTENSIONS = False
@@ -90,7 +95,27 @@ def mix_bits(a: np.uint32, b: np.uint32) -> Tuple[np.uint32, np.uint32]:
     return a, b
 
 
-@njit(parallel=True, fastmath=True)
+@njit(fastmath=True)
+def mix_lanes(a, b):
+    """mix_bits applied to whole uint32 lane arrays at once.
+
+    Same operation sequence as the scalar mix_bits, expressed as
+    elementwise array ops so the independent state lanes are mixed in one
+    vectorized pass instead of a Python-level loop per lane.
+    """
+    a = (a + b) & 0xFFFFFFFF
+    b = rotate_left(b, 13) ^ a
+    a = (rotate_left(a, 7) + b) & 0xFFFFFFFF
+    b = rotate_left(b, 17) ^ a
+    a = (a + b) & 0xFFFFFFFF
+
+    # Additional mixing for quantum resistance
+    b = rotate_left(b, 5) ^ ((a * 0x9e3779b9) & 0xFFFFFFFF)
+    a = (rotate_left(a, 11) + rotate_left(b, 19)) & 0xFFFFFFFF
+    return a, b
+
+
+@njit(fastmath=True)
 def numba_enhanced_grover_hash(data: bytes, digest_size: int = 32) -> bytes:
     """
     JIT-compiled implementation of enhanced Grover-inspired hash function
@@ -116,42 +141,51 @@ def numba_enhanced_grover_hash(data: bytes, digest_size: int = 32) -> bytes:
     padded_data = bytearray(padded_size)
     padded_data[:len(data)] = data
     
-    # Convert to chunks
+    # Convert to chunks by reinterpreting the padded buffer as uint32
+    # words - one memcpy-speed view instead of a shift/or loop per byte
+    # (the per-byte assembly was little-endian, i.e. native order here)
     chunks = np.empty(padded_size // chunk_size + 1, dtype=np.uint32)
-    for i in prange(padded_size // chunk_size):
-        chunk = 0
-        for j in range(chunk_size):
-            if i * chunk_size + j < padded_size:
-                chunk |= padded_data[i * chunk_size + j] << (j * 8)
-        chunks[i] = chunk
+    chunks[:-1] = np.frombuffer(padded_data, dtype=np.uint32)
     
     # Add the length as the last chunk to prevent length extension attacks
     chunks[-1] = len(data)
     
+    # The state lanes are updated independently within a chunk, so the
+    # whole per-lane mix loop runs as array operations across all lanes
+    # (8/16-wide SIMD after vectorization) instead of lane-by-lane.
+    # The prime gathers are identical for every chunk, so they are built
+    # once here rather than re-gathered (with a modulo) per chunk:
+    # chunk_mix seeds the b lanes, round_mul[r] is the per-round
+    # non-linearity multiplier
+    lane_idx = np.arange(len(state)) % len(PRIMES)
+    chunk_mix = PRIMES[lane_idx] ^ EXTRA_PRIMES[lane_idx]
+    round_mul = PRIMES[(lane_idx.reshape(1, -1)
+                        + np.arange(4).reshape(-1, 1)) % len(PRIMES)]
+
     # Process each chunk
     for chunk in chunks:
         # Enhanced state update with better mixing
-        for i in prange(len(state)):
-            a = state[i]
-            b = chunk ^ PRIMES[i % len(PRIMES)] ^ EXTRA_PRIMES[i % len(EXTRA_PRIMES)]
-            
-            # Apply multiple mixing rounds for better diffusion
-            for r in range(4):  # Increased from 3 to 4 rounds
-                a, b = mix_bits(a, b)
-                b = rotate_left(b, ROTATIONS[r % len(ROTATIONS)])
-                # Add non-linearity with multiplication by prime
-                a = (a * PRIMES[(i + r) % len(PRIMES)]) & 0xFFFFFFFF
-            
-            state[i] = a ^ b
+        a = state
+        b = chunk ^ chunk_mix
+
+        # Apply multiple mixing rounds for better diffusion
+        for r in range(4):  # Increased from 3 to 4 rounds
+            a, b = mix_lanes(a, b)
+            b = rotate_left(b, ROTATIONS[r % len(ROTATIONS)])
+            # Add non-linearity with multiplication by prime
+            a = (a * round_mul[r]) & 0xFFFFFFFF
+
+        state = (a ^ b).astype(np.uint32)
         
-        # State diffusion after each chunk (improved version)
-        temp_state = state.copy()
-        for i in prange(len(state)):
-            j = (i + 1) % len(state)
-            k = (i + len(state)//2) % len(state)
-            # Enhanced diffusion using additional rotations and operations
-            state[i] = rotate_left(temp_state[i], 5) ^ temp_state[j] ^ rotate_left(temp_state[k], 13)
-            state[i] = (state[i] + rotate_left(state[i], 11)) & 0xFFFFFFFF
+        # State diffusion after each chunk (improved version). Each lane
+        # reads only the pre-diffusion state, so the neighbour accesses
+        # (i + 1 and i + half, wrapped) become np.roll and the loop runs
+        # as whole-array operations
+        temp_state = state
+        state = (rotate_left(temp_state, 5)
+                 ^ np.roll(temp_state, -1)
+                 ^ rotate_left(np.roll(temp_state, -(len(state) // 2)), 13))
+        state = ((state + rotate_left(state, 11)) & 0xFFFFFFFF).astype(np.uint32)
     
     # Final mixing rounds with additional operations
     for r in range(digest_size * 2):  # More rounds for better security
@@ -192,7 +226,7 @@ def optimized_grover_hash(data: bytes, digest_size: int = 32) -> bytes:
         return numba_enhanced_grover_hash(data, digest_size)
 
 
-@njit(parallel=True, fastmath=True)
+@njit(fastmath=True)
 def numba_enhanced_shor_hash(data: bytes, digest_size: int = 32) -> bytes:
     """
     JIT-compiled implementation of enhanced Shor-inspired hash function
@@ -222,23 +256,25 @@ def numba_enhanced_shor_hash(data: bytes, digest_size: int = 32) -> bytes:
     padded_data = bytearray(padded_size)
     padded_data[:len(data)] = data
     
+    # The whole padded buffer reinterpreted as uint32 words, replacing
+    # the per-byte chunk assembly inside the block loop (same
+    # little-endian layout, zero-copy)
+    words = np.frombuffer(padded_data, dtype=np.uint32)
+
     # Process each block with enhanced security
     for block_start in range(0, padded_size, block_size):
-        block = padded_data[block_start:block_start+block_size]
-        
         # Process the block in 32-bit chunks
         for i in range(0, block_size, 4):
-            chunk = 0
-            for j in range(4):
-                if i + j < len(block):
-                    chunk |= block[i + j] << (j * 8)
+            chunk = words[(block_start + i) // 4]
             
             # Update state with chunk
             idx = (i // 4) % state_size
             state[idx] ^= chunk
             
-            # Apply mixing function with quantum resistance enhancements
-            for j in prange(state_size):
+            # Apply mixing function with quantum resistance enhancements.
+            # Iteration j writes state[j + 1], which the next iteration
+            # reads - a loop-carried dependency, so this must stay range
+            for j in range(state_size):
                 k = (j + 1) % state_size
                 
                 # Enhanced mixing inspired by Shor's period finding
@@ -256,15 +292,19 @@ def numba_enhanced_shor_hash(data: bytes, digest_size: int = 32) -> bytes:
                 state[j] = a
                 state[k] = b
         
-        # Apply permutation after each block with enhanced complexity
+        # Apply permutation after each block with enhanced complexity.
+        # The write index (i*7 + 1) % n can collide when n shares a
+        # factor with 7's cycle, so the iteration order matters: range
         temp = state.copy()
-        for i in prange(state_size):
+        for i in range(state_size):
             j = (i * 7 + 1) % state_size
             k = (i * 5 + 3) % state_size  # Additional mixing point
             state[j] = temp[i] ^ rotate_left(temp[k], 13)
     
-    # Finalization with data length and additional operations
-    for i in prange(state_size):
+    # Finalization with data length and additional operations. Each
+    # iteration reads state words the previous ones rewrote, so this is
+    # strictly sequential
+    for i in range(state_size):
         state[i] ^= data_length
         
         # Apply enhanced final diffusion
@@ -305,7 +345,7 @@ def optimized_shor_hash(data: bytes, digest_size: int = 32) -> bytes:
         return numba_enhanced_shor_hash(data, digest_size)
 
 
-@njit(parallel=True, fastmath=True)
+@njit(fastmath=True)
 def numba_enhanced_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
     """
     JIT-compiled implementation of enhanced hybrid hash function combining 
@@ -345,34 +385,34 @@ def numba_enhanced_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
     # Process with Shor-inspired approach
     shor_result = numba_enhanced_shor_hash(data2, half_size)
     
-    # Combine the results with additional mixing for quantum resistance
-    result = bytearray(digest_size)
+    # Combine the results with additional mixing for quantum resistance.
+    # The interleaved bytes and the uint32 mixing state share one buffer:
+    # strided writes do the interleave, a uint32 view does the hydration
+    # and the final serialization is a plain slice - no byte-by-byte
+    # shift loops between the two representations
+    state_size = (digest_size + 3) // 4
+    combined = np.zeros(state_size * 4, dtype=np.uint8)
+    grover_bytes = np.frombuffer(grover_result, dtype=np.uint8)
+    shor_bytes = np.frombuffer(shor_result, dtype=np.uint8)
     
     # Interleave the results for better mixing
-    for i in prange(half_size):
-        result[i*2] = grover_result[i]
-        result[i*2+1] = shor_result[i]
+    combined[0:2 * half_size:2] = grover_bytes
+    combined[1:2 * half_size:2] = shor_bytes
     
     # If digest size is odd, add one more byte
     if remaining:
         # XOR the last bytes of both results for the remaining byte
-        result[-1] = grover_result[-1] ^ shor_result[-1]
+        combined[digest_size - 1] = \
+            grover_bytes[half_size - 1] ^ shor_bytes[half_size - 1]
     
-    # Enhance security with a final mixing pass
-    # Convert to 32-bit chunks for processing
-    state_size = (digest_size + 3) // 4
-    state = np.zeros(state_size, dtype=np.uint32)
-    
-    for i in prange(digest_size):
-        byte_val = result[i]
-        state_idx = i // 4
-        shift = (i % 4) * 8
-        state[state_idx] |= byte_val << shift
+    # Enhance security with a final mixing pass, working on the same
+    # buffer viewed as little-endian 32-bit words
+    state = combined.view(np.uint32)
     
     # Apply multiple rounds of mixing for better diffusion
     for round in range(4):  # Multiple rounds for security
         # Mix each state element with others
-        for i in prange(state_size):
+        for i in range(state_size):
             for j in range(1, min(4, state_size)):
                 idx = (i + j) % state_size
                 a = state[i]
@@ -381,14 +421,7 @@ def numba_enhanced_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
                 state[i] = a
                 state[idx] = b
     
-    # Convert back to bytes
-    for i in prange(state_size):
-        for j in range(4):
-            idx = i * 4 + j
-            if idx < digest_size:
-                result[idx] = (state[i] >> (j * 8)) & 0xFF
-    
-    return bytes(result) 
+    return combined[:digest_size].tobytes() 
 
 
 def optimized_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
@@ -403,7 +436,8 @@ def optimized_hybrid_hash(data: bytes, digest_size: int = 32) -> bytes:
     Returns:
         Hashed output as bytes
     """
+    # Same word-level avalanche finalizer as the non-optimized hybrid path
     if _HAVE_C_EXTENSIONS:
-        return optimized_hybrid_hash_c(data, digest_size)
+        return fmix64_finalize(optimized_hybrid_hash_c(data, digest_size))
     else:
-        return numba_enhanced_hybrid_hash(data, digest_size) 
\ No newline at end of file
+        return fmix64_finalize(numba_enhanced_hybrid_hash(data, digest_size))
\ No newline at end of file
@@ -6,6 +6,8 @@ This module provides easy access to all quantum-inspired hash and key functions.
 
 from typing import Tuple, Dict, Union, Optional, List
 
+import numpy as np
+
 from .core.grover import grover_hash
 from .core.shor import shor_hash, shor_inspired_key_generation
 from .core.improved_hash import (
@@ -71,6 +73,85 @@ class DiracHash:
         # Fall back to non-optimized implementations
         return quantum_hash(algorithm_signature, algorithm, digest_size)
     
+    @staticmethod
+    def get_hasher(algorithm: str = 'improved', digest_size: int = 32,
+                   optimized: bool = True):
+        """
+        Resolve the algorithm dispatch once and return a direct hash callable.
+
+        DiracHash.hash re-parses the algorithm string and walks the dispatch
+        branches on every call, which matters in tight loops like the
+        benchmarks. The returned callable has the implementation function,
+        the algorithm-signature prefix and the digest size baked in, so each
+        call is a single function call with no string comparison or kwargs
+        parsing.
+
+        Args:
+            algorithm: Algorithm to resolve (see ALGORITHMS)
+            digest_size: Size of the output hash in bytes
+            optimized: Whether to use SIMD-optimized implementations when available
+
+        Returns:
+            A callable taking the input data and returning the hash bytes
+        """
+        algo = algorithm.lower()
+        prefix = algo.encode() + b':'
+
+        # Resolve the implementation function once, mirroring hash()'s branches
+        target = None
+        if optimized and _HAVE_OPTIMIZED:
+            if algo in ('improved_grover', 'optimized_grover'):
+                target = optimized_grover_hash
+            elif algo in ('improved_shor', 'optimized_shor'):
+                target = optimized_shor_hash
+            elif algo in ('improved', 'optimized'):
+                target = optimized_hybrid_hash
+
+        if target is not None:
+            def hasher(data, _target=target, _prefix=prefix, _size=digest_size):
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                return _target(_prefix + data, _size)
+        else:
+            def hasher(data, _prefix=prefix, _algo=algo, _size=digest_size):
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                return quantum_hash(_prefix + data, _algo, _size)
+
+        return hasher
+
+    @staticmethod
+    def hash_many(data_rows, algorithm: str = 'improved',
+                  digest_size: int = 32, optimized: bool = True) -> np.ndarray:
+        """
+        Hash a batch of equal-length inputs into one digest matrix.
+
+        Resolves the algorithm dispatch once (see get_hasher) and writes
+        every digest straight into a preallocated (N, digest_size) uint8
+        array, so batch callers pay a single dispatch and no per-digest
+        bytes-object bookkeeping.
+
+        Args:
+            data_rows: Array of shape (N, L) with one uint8 input per row,
+                or a sequence of equal-length bytes objects
+            algorithm: Algorithm to use (see ALGORITHMS)
+            digest_size: Size of each output hash in bytes
+            optimized: Whether to use SIMD-optimized implementations when available
+
+        Returns:
+            Array of shape (N, digest_size) with one digest per row
+        """
+        hasher = DiracHash.get_hasher(algorithm, digest_size, optimized)
+        if isinstance(data_rows, np.ndarray):
+            rows = np.ascontiguousarray(data_rows, dtype=np.uint8)
+            inputs = [rows[i].tobytes() for i in range(rows.shape[0])]
+        else:
+            inputs = data_rows
+        out = np.empty((len(inputs), digest_size), dtype=np.uint8)
+        for i, data in enumerate(inputs):
+            out[i] = np.frombuffer(hasher(data), dtype=np.uint8)
+        return out
+
     @staticmethod
     def hmac(key: Union[bytes, str], data: Union[bytes, str],
              algorithm: str = 'improved', digest_size: int = 32, 
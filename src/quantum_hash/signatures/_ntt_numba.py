@@ -0,0 +1,62 @@
+"""
+Numba-accelerated polynomial multiplication kernels for Dilithium.
+
+The reference implementation of CRYSTALS-Dilithium speeds up ring
+multiplication with the Number Theoretic Transform (NTT). This codebase uses
+a simplified schoolbook multiplication instead (see DilithiumSignature.poly_mul),
+so these kernels JIT-compile exactly that loop: the coefficient-by-coefficient
+butterfly-style inner loop is what Numba's LLVM backend auto-vectorizes, which
+gives a large speedup over the pure Python version while producing
+bit-identical results.
+
+The module is optional: if Numba is not installed, NUMBA_AVAILABLE is False
+and DilithiumSignature falls back to the pure Python path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=False)
+    def poly_mul_schoolbook(a, b, n, q):
+        """Full schoolbook multiplication in Z_q[X]/(X^n + 1).
+
+        Mirrors the non-fast branch of DilithiumSignature.poly_mul: int64
+        accumulation to avoid overflow, reduction by X^n + 1 via the sign
+        flip on wrapped indices, final reduction modulo q.
+        """
+        result = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            ai = np.int64(a[i])
+            for j in range(n):
+                idx = (i + j) % n
+                if (i + j) < n:
+                    result[idx] += ai * np.int64(b[j])
+                else:
+                    result[idx] -= ai * np.int64(b[j])
+        return np.mod(result, q)
+
+    @njit(cache=True, fastmath=False)
+    def poly_mul_fast(a, b, n, q, step):
+        """Approximate strided multiplication matching the fast_mode branch.
+
+        Only every step-th product term is computed, scaled by step, exactly
+        as in the pure Python fast path so fast_mode signatures stay
+        reproducible across installs with and without Numba.
+        """
+        result = np.zeros(n, dtype=np.int64)
+        for i in range(0, n, step):
+            ai = np.int64(a[i])
+            for j in range(0, n, step):
+                idx = (i + j) % n
+                if (i + j) < n:
+                    result[idx] += ai * np.int64(b[j]) * step
+                else:
+                    result[idx] -= ai * np.int64(b[j]) * step
+        return np.mod(result, q)
@@ -124,12 +124,12 @@ class KyberKEM:
         Returns:
             Polynomial as numpy array
         """
-        # Simplified decoding
+        # Simplified decoding - view the buffer as little-endian uint16 and
+        # reduce modulo q in one vectorized pass instead of a per-coefficient loop
+        count = min(self.n, len(data) // 2)
+        coeffs = np.frombuffer(data, dtype='<u2', count=count)
         poly = np.zeros(self.n, dtype=np.int16)
-        for i in range(min(self.n, len(data) // 2)):
-            # Decode each 2-byte coefficient
-            coeff = int.from_bytes(data[i*2:i*2+2], byteorder='little')
-            poly[i] = coeff % self.q
+        poly[:count] = coeffs % self.q
         return poly
     
     def poly_mul(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
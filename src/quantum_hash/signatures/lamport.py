@@ -6,10 +6,12 @@ for use in cryptocurrency wallets, with enhanced security against quantum attack
 """
 
 import hashlib
+import hmac
 import os
 import secrets
 import numpy as np
 from typing import Dict, List, Tuple, Union, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
 import time
 import functools
 import json
@@ -44,6 +46,10 @@ class LamportSignature:
         """
         self.hasher = DiracHash()
         self.hash_algorithm = hash_algorithm
+        # Resolve the algorithm dispatch once; every message digest and
+        # chain hash below goes through this direct callable instead of
+        # re-parsing the algorithm string per call (see DiracHash.get_hasher)
+        self._hash = DiracHash.get_hasher(hash_algorithm)
         self.digest_size = digest_size
         self.cache_enabled = cache_enabled
         self.compact_mode = compact_mode
@@ -87,39 +93,78 @@ class LamportSignature:
         
         start_time = time.time()
         
-        # For each bit position of the message digest
-        for i in range(self.digest_size * 8):
+        num_bits = self.digest_size * 8
+        seed_prefix = seed.hex()[:8]
+
+        # Derive every private key value in one batch. All position seeds
+        # have the same length, so the 2 * num_bits derivations go through
+        # DiracHash.hash_many as a single (N, L) matrix - one algorithm
+        # dispatch and no per-value bytes bookkeeping instead of 512
+        # separate hash calls (the multi-buffer pattern, at the level this
+        # library hashes at). The preimage matrix itself is assembled with
+        # broadcast column writes rather than 2 * num_bits Python-level
+        # bytes concatenations: every row is seed | counter | bit | salt.
+        seed_len = len(seed)
+        salt_len = len(self.global_salt)
+        preimages = np.empty((2 * num_bits, seed_len + 4 + 1 + salt_len),
+                             dtype=np.uint8)
+        preimages[:, :seed_len] = np.frombuffer(seed, dtype=np.uint8)
+        counters = np.repeat(np.arange(num_bits, dtype='<u4'), 2)
+        preimages[:, seed_len:seed_len + 4] = \
+            counters.view(np.uint8).reshape(-1, 4)
+        preimages[:, seed_len + 4] = np.tile(
+            np.array([0, 1], dtype=np.uint8), num_bits)
+        preimages[:, seed_len + 5:] = np.frombuffer(
+            self.global_salt, dtype=np.uint8)
+
+        priv_digests = DiracHash.hash_many(
+            preimages, algorithm=self.hash_algorithm,
+            digest_size=self.digest_size
+        )
+
+        # Materialize the whole matrix as one contiguous blob and slice the
+        # per-value bytes out of it: 2 * num_bits slices of one buffer
+        # instead of that many per-row ndarray conversions
+        priv_blob = priv_digests.tobytes()
+        row_size = priv_digests.shape[1]
+
+        # Resolve against the cache so reused seeds still hit it
+        for i in range(num_bits):
             private_key[i] = {}
             public_key[i] = {}
-            
-            # For each possible bit value (0 or 1)
             for bit in [0, 1]:
-                # Deterministically derive private key from seed using position and bit value
-                # This is more efficient and allows for partial key reconstruction
-                pos_seed = seed + i.to_bytes(4, byteorder='little') + bytes([bit])
-                
-                # Generate a deterministic value for the private key
-                private_key_gen = lambda: self.hasher.hash(
-                    pos_seed + self.global_salt, 
-                    algorithm=self.hash_algorithm,
-                    digest_size=self.digest_size
-                )
-                
-                private_key[i][bit] = self._get_cached_or_generate(
-                    f"{seed.hex()[:8]}_{i}_{bit}", 
-                    private_key_gen
-                )
-                
-                # Compute the corresponding public key
-                public_key_gen = lambda: self.hasher.hash(
-                    private_key[i][bit] + self.global_salt, 
-                    algorithm=self.hash_algorithm
-                )
-                
-                public_key[i][bit] = self._get_cached_or_generate(
-                    f"{seed.hex()[:8]}_{i}_{bit}_pub", 
-                    public_key_gen
-                )
+                cache_key = f"{seed_prefix}_{i}_{bit}"
+                if self.cache_enabled and cache_key in self._key_cache:
+                    private_key[i][bit] = self._key_cache[cache_key]
+                else:
+                    start = (2 * i + bit) * row_size
+                    private_key[i][bit] = priv_blob[start:start + row_size]
+                    if self.cache_enabled:
+                        self._key_cache[cache_key] = private_key[i][bit]
+
+        # Public keys hash the (fixed-length) private values, so they batch
+        # the same way
+        pub_digests = DiracHash.hash_many(
+            [
+                private_key[i][bit] + self.global_salt
+                for i in range(num_bits) for bit in [0, 1]
+            ],
+            algorithm=self.hash_algorithm
+        )
+
+        pub_blob = pub_digests.tobytes()
+        pub_row_size = pub_digests.shape[1]
+
+        for i in range(num_bits):
+            for bit in [0, 1]:
+                cache_key = f"{seed_prefix}_{i}_{bit}_pub"
+                if self.cache_enabled and cache_key in self._key_cache:
+                    public_key[i][bit] = self._key_cache[cache_key]
+                else:
+                    start = (2 * i + bit) * pub_row_size
+                    public_key[i][bit] = pub_blob[start:start + pub_row_size]
+                    if self.cache_enabled:
+                        self._key_cache[cache_key] = public_key[i][bit]
         
         # Add key metadata for wallet use
         private_key['_metadata'] = {
@@ -156,8 +201,14 @@ class LamportSignature:
             message = message.encode('utf-8')
         
         # Hash the message using the same algorithm used for signing
-        message_digest = self.hasher.hash(message, algorithm=self.hash_algorithm)
-        
+        message_digest = self._hash(message)
+
+        # Unpack the digest into a bit vector once (MSB first, matching the
+        # 1 << (7 - bit_pos) convention) instead of re-deriving each bit
+        # with shift/mask arithmetic in the per-position loops below
+        digest_bits = np.unpackbits(
+            np.frombuffer(message_digest, dtype=np.uint8))
+
         # Check metadata to ensure correct key format
         if '_metadata' not in private_key:
             raise ValueError("Invalid private key format - missing metadata")
@@ -188,11 +239,7 @@ class LamportSignature:
             bit_values = []
             
             for pos in subset:
-                # Extract the bit at position pos
-                byte_pos = pos // 8
-                bit_pos = pos % 8
-                bit_mask = 1 << (7 - bit_pos)  # Fixed bit mask calculation
-                bit_value = 1 if message_digest[byte_pos] & bit_mask else 0
+                bit_value = int(digest_bits[pos])
                 
                 # Add to the signature
                 revealed_keys.append(private_key[pos][bit_value])
@@ -224,21 +271,12 @@ class LamportSignature:
             
             return bytes(compact_sig)
         else:
-            # Original mode - full list of revealed values
-            signature = []
-            
-            # For each bit in the message digest
-            for i in range(self.digest_size * 8):
-                # Extract the bit at position i
-                bit_position = i // 8
-                bit_pos = i % 8
-                bit_mask = 1 << (7 - bit_pos)  # Fixed bit mask calculation
-                bit_value = 1 if message_digest[bit_position] & bit_mask else 0
-                
-                # Add the corresponding private key value to the signature
-                signature.append(private_key[i][bit_value])
-            
-            return signature
+            # Original mode - full list of revealed values: one private
+            # key component per digest bit
+            return [
+                private_key[i][int(digest_bits[i])]
+                for i in range(self.digest_size * 8)
+            ]
     
     def verify(self, message: Union[str, bytes], signature: Union[List[bytes], bytes], 
                public_key: Dict) -> bool:
@@ -275,7 +313,7 @@ class LamportSignature:
                 msg_digest = signature[2:34]
                 
                 # Hash the message to verify
-                computed_digest = self.hasher.hash(message, algorithm=self.hash_algorithm)
+                computed_digest = self._hash(message)
                 
                 # Check if digests match
                 if msg_digest != computed_digest:
@@ -317,32 +355,33 @@ class LamportSignature:
                 # Size of each key
                 key_size = self.digest_size
                 
-                # Verify each revealed key
+                # Check if signature is long enough for all revealed keys
+                if keys_offset + subset_size * key_size > len(signature):
+                    return False
+
+                # Hash all revealed keys in one batch (fixed-length inputs),
+                # resolving the algorithm dispatch once instead of per key
+                key_block = bytes(
+                    signature[keys_offset:keys_offset + subset_size * key_size]
+                )
+                computed = DiracHash.hash_many(
+                    [
+                        key_block[i * key_size:(i + 1) * key_size]
+                        + self.global_salt
+                        for i in range(subset_size)
+                    ],
+                    algorithm=self.hash_algorithm
+                )
+
+                # Verify each revealed key against the public key
                 for i in range(subset_size):
                     pos = positions[i]
                     bit = sig_bit_values[i]
-                    
-                    # Calculate where the key is in the signature
-                    key_pos = keys_offset + i * key_size
-                    
-                    # Check if signature is long enough
-                    if key_pos + key_size > len(signature):
-                        return False
-                    
-                    # Extract the key
-                    key = signature[key_pos:key_pos + key_size]
-                    
-                    # Hash it with the salt
-                    computed_hash = self.hasher.hash(
-                        key + self.global_salt,
-                        algorithm=self.hash_algorithm
-                    )
-                    
-                    # Verify against public key
+
                     if pos not in public_key or bit not in public_key[pos]:
                         return False
-                    
-                    if computed_hash != public_key[pos][bit]:
+
+                    if computed[i].tobytes() != public_key[pos][bit]:
                         return False
                 
                 return True
@@ -355,28 +394,166 @@ class LamportSignature:
         else:
             # Standard signature format
             # Hash the message using the same algorithm
-            message_digest = self.hasher.hash(message, algorithm=self.hash_algorithm)
+            message_digest = self._hash(message)
+            
+            num_bits = self.digest_size * 8
+
+            # Hash every signature component in one batch; the components
+            # are all digest-sized, so the 256 chain hashes collapse into
+            # a single dispatch
+            sig_hashes = DiracHash.hash_many(
+                [signature[i] + self.global_salt for i in range(num_bits)],
+                algorithm=self.hash_algorithm
+            )
+
+            # Select the expected public key values along the digest bits
+            # and compare everything at once, constant-time: no per-bit
+            # Python comparison and no early exit leaking the position of
+            # the first mismatch
+            digest_bits = np.unpackbits(
+                np.frombuffer(message_digest, dtype=np.uint8))
+            expected = b''.join(
+                public_key[i][int(digest_bits[i])] for i in range(num_bits))
             
-            # Verify the signature
-            for i in range(self.digest_size * 8):
+            return hmac.compare_digest(sig_hashes.tobytes(), expected)
+    
+    def verify_batch(self, message: Union[str, bytes], signature: List[bytes],
+                     public_key: Dict, max_workers: Optional[int] = None) -> bool:
+        """
+        Verify a standard-format Lamport signature with parallel chain hashing.
+
+        The per-bit hash chains are independent, so they are checked in
+        chunks across a thread pool. Compact signatures fall back to the
+        sequential verify().
+
+        Args:
+            message: The message that was signed
+            signature: The signature to verify (standard list format)
+            public_key: The public key to use for verification
+            max_workers: Number of worker threads (defaults to CPU count)
+
+        Returns:
+            True if the signature is valid, False otherwise
+        """
+        # Convert string message to bytes if needed
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+
+        # Check metadata to ensure correct key format
+        if '_metadata' not in public_key:
+            raise ValueError("Invalid public key format - missing metadata")
+
+        # Compact signatures carry positions/bit values inline - keep those
+        # on the sequential path
+        if isinstance(signature, (bytes, bytearray)) and signature[:2] == b'DC':
+            return self.verify(message, signature, public_key)
+
+        # Hash the message using the same algorithm
+        message_digest = self._hash(message)
+
+        num_bits = self.digest_size * 8
+
+        def check_range(start: int, stop: int) -> bool:
+            """Check the hash chains for bit positions [start, stop)."""
+            for i in range(start, stop):
                 # Extract the bit at position i from the message digest
                 bit_position = i // 8
                 bit_pos = i % 8
-                bit_mask = 1 << (7 - bit_pos)  # Fixed bit mask calculation
+                bit_mask = 1 << (7 - bit_pos)
                 bit_value = 1 if message_digest[bit_position] & bit_mask else 0
-                
+
                 # Hash the signature component
-                sig_hash = self.hasher.hash(
-                    signature[i] + self.global_salt, 
-                    algorithm=self.hash_algorithm
-                )
-                
+                sig_hash = self._hash(signature[i] + self.global_salt)
+
                 # Compare with the public key component
                 if sig_hash != public_key[i][bit_value]:
                     return False
-            
             return True
-    
+
+        workers = max_workers or os.cpu_count() or 4
+        chunk = -(-num_bits // workers)  # ceil division
+        starts = range(0, num_bits, chunk)
+        stops = [min(start + chunk, num_bits) for start in starts]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return all(executor.map(check_range, starts, stops))
+
+    def batch_verify(self, messages: List[Union[str, bytes]],
+                     signatures: List[Union[List[bytes], bytes]],
+                     public_key: Dict) -> List[bool]:
+        """
+        Verify several signatures against one public key in a single batch.
+
+        All standard-format signature components across the whole batch are
+        hashed with one DiracHash.hash_many call and compared against the
+        public key as a vectorized array operation, so the per-call
+        dispatch and comparison overhead is paid once for the batch rather
+        than once per signature. Compact signatures fall back to verify().
+
+        Args:
+            messages: The messages that were signed
+            signatures: The signatures to verify, aligned with messages
+            public_key: The public key all signatures are checked against
+
+        Returns:
+            A list of booleans, one per (message, signature) pair
+        """
+        if len(messages) != len(signatures):
+            raise ValueError("messages and signatures must have equal length")
+
+        # Check metadata to ensure correct key format
+        if '_metadata' not in public_key:
+            raise ValueError("Invalid public key format - missing metadata")
+
+        num_bits = self.digest_size * 8
+        results: List[Optional[bool]] = [None] * len(messages)
+
+        # Collect the standard-format entries; compact signatures carry
+        # positions and bit values inline and keep their sequential path
+        batch_indices = []
+        components = []
+        digests = []
+        for idx, (message, signature) in enumerate(zip(messages, signatures)):
+            if isinstance(signature, (bytes, bytearray)):
+                results[idx] = self.verify(message, signature, public_key)
+                continue
+            if len(signature) != num_bits:
+                results[idx] = False
+                continue
+            if isinstance(message, str):
+                message = message.encode('utf-8')
+            digests.append(
+                self._hash(message))
+            batch_indices.append(idx)
+            components.extend(
+                signature[i] + self.global_salt for i in range(num_bits))
+
+        if not batch_indices:
+            return results
+
+        # One dispatch for every component of every batched signature
+        sig_hashes = DiracHash.hash_many(
+            components, algorithm=self.hash_algorithm)
+        hash_len = sig_hashes.shape[1]
+        sig_hashes = sig_hashes.reshape(len(batch_indices), num_bits, hash_len)
+
+        # Public key as a (num_bits, 2, hash_len) matrix, built once
+        pub_matrix = np.frombuffer(
+            b''.join(public_key[i][bit]
+                     for i in range(num_bits) for bit in (0, 1)),
+            dtype=np.uint8
+        ).reshape(num_bits, 2, hash_len)
+
+        positions = np.arange(num_bits)
+        for row, (idx, digest) in enumerate(zip(batch_indices, digests)):
+            # Message digest bits, MSB first - same convention as sign()
+            bits = np.unpackbits(
+                np.frombuffer(digest, dtype=np.uint8))[:num_bits]
+            expected = pub_matrix[positions, bits]
+            results[idx] = bool(np.array_equal(sig_hashes[row], expected))
+
+        return results
+
     def serialize_keys(self, keys: Dict, format_type: str = 'json') -> str:
         """
         Serialize keys for storage in wallets.
@@ -389,17 +566,32 @@ class LamportSignature:
             Serialized key string
         """
         if format_type == 'json':
-            # Convert binary data to hex strings for JSON serialization
+            # Convert binary data to hex strings for JSON serialization.
+            # All bit-pair values are concatenated and hex-encoded with one
+            # binascii.hexlify call, then sliced back per field - one C
+            # call instead of 512 per-value .hex() dispatches.
             serializable_keys = {}
             
+            entries = []   # (key, bit, start, stop) offsets into the blob
+            chunks = []
+            offset = 0
             for k, v in keys.items():
                 if k == '_metadata':
                     serializable_keys[k] = v
-                else:
-                    serializable_keys[k] = {
-                        '0': v[0].hex() if isinstance(v[0], bytes) else v[0],
-                        '1': v[1].hex() if isinstance(v[1], bytes) else v[1]
-                    }
+                    continue
+                serializable_keys[k] = {}
+                for bit in ('0', '1'):
+                    value = v[int(bit)]
+                    if isinstance(value, bytes):
+                        chunks.append(value)
+                        entries.append((k, bit, offset, offset + len(value)))
+                        offset += len(value)
+                    else:
+                        serializable_keys[k][bit] = value
+            
+            hex_blob = binascii.hexlify(b''.join(chunks)).decode('ascii')
+            for k, bit, start, stop in entries:
+                serializable_keys[k][bit] = hex_blob[2 * start:2 * stop]
             
             return json.dumps(serializable_keys)
         elif format_type == 'compact':
@@ -478,7 +670,7 @@ class LamportSignature:
                 key_bytes.extend(public_key[i][0][:4])  # Use only first 4 bytes to keep size manageable
         
         # Create a compact representation
-        address_bytes = self.hasher.hash(bytes(key_bytes), algorithm=self.hash_algorithm)
+        address_bytes = self._hash(bytes(key_bytes))
         
         # Format the address according to the specified format
         if address_format == 'hex':
@@ -88,6 +88,16 @@ class TestLamportSignature(unittest.TestCase):
         # Verify the tampered signature should fail
         self.assertFalse(self.lamport.verify(self.test_message, bytes(tampered_signature) if isinstance(tampered_signature, bytearray) else tampered_signature, self.public_key))
     
+    def test_verify_batch(self):
+        """Test parallel batch verification of standard signatures."""
+        lamport = LamportSignature(compact_mode=False)
+        private_key, public_key = lamport.generate_keypair()
+        signature = lamport.sign(self.test_message, private_key)
+
+        # Batch verification should agree with the sequential path
+        self.assertTrue(lamport.verify_batch(self.test_message, signature, public_key))
+        self.assertFalse(lamport.verify_batch(self.test_message + " modified", signature, public_key))
+
     def test_different_hash_algorithms(self):
         """Test signing and verification with different hash algorithms."""
         algorithms = ['improved', 'grover', 'shor', 'hybrid', 'improved_grover', 'improved_shor']
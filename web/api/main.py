@@ -5,8 +5,11 @@ This module provides a FastAPI-based API for the Dirac Hashes library,
 offering endpoints for hash generation, digital signatures, and key management.
 """
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 import sys
 import os
@@ -22,6 +25,7 @@ app = FastAPI(
     title="Dirac Hashes API",
     description="API for quantum-inspired cryptographic primitives",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -33,6 +37,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger JSON bodies (base64 keys, hex digests compress well);
+# minimum_size keeps tiny responses like /algorithms uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Import routes
 from web.api.routes import hash_routes, signature_routes, kem_routes
 
@@ -41,6 +49,12 @@ app.include_router(hash_routes.router, prefix="/api/hash", tags=["Hash Functions
 app.include_router(signature_routes.router, prefix="/api/signatures", tags=["Digital Signatures"])
 app.include_router(kem_routes.router, prefix="/api/kem", tags=["Key Encapsulation"])
 
+@app.on_event("startup")
+async def configure_threadpool():
+    """Enlarge the default threadpool used for offloaded CPU-bound work."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint that returns API information."""
@@ -57,4 +71,20 @@ async def root():
     }
 
 if __name__ == "__main__":
-    uvicorn.run("web.api.main:app", host="0.0.0.0", port=8000, reload=True, log_level="debug") 
\ No newline at end of file
+    # Request uvloop and httptools explicitly: if either is missing uvicorn
+    # silently falls back to the slower stdlib loop and h11 parser.
+    # Multiple workers sidestep the GIL for the CPU-bound hash/KEM endpoints;
+    # set DEV=1 for a single auto-reloading process during development.
+    if os.environ.get("DEV"):
+        uvicorn.run("web.api.main:app", host="0.0.0.0", port=8000,
+                    reload=True, log_level="debug")
+    else:
+        uvicorn.run(
+            "web.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+            log_level="info",
+        ) 
\ No newline at end of file
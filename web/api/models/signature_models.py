@@ -2,7 +2,7 @@
 Data models for signature API endpoints.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from web.api.models.hash_models import HashAlgorithm
@@ -17,6 +17,10 @@ class SignatureScheme(str, Enum):
 
 class KeyPairRequest(BaseModel):
     """Request model for key pair generation."""
+    # Request models are read-only once parsed; frozen skips pydantic's
+    # mutation bookkeeping and extra='forbid' rejects junk fields up front
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     scheme: SignatureScheme = Field(
         ..., 
         description="Signature scheme to use"
@@ -45,6 +49,10 @@ class KeyPairResponse(BaseModel):
 
 class SignRequest(BaseModel):
     """Request model for message signing."""
+    # Request models are read-only once parsed; frozen skips pydantic's
+    # mutation bookkeeping and extra='forbid' rejects junk fields up front
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     message: str = Field(..., description="Message to sign")
     private_key: str = Field(..., description="Private key in hex format")
     scheme: SignatureScheme = Field(
@@ -73,6 +81,10 @@ class SignResponse(BaseModel):
 
 class VerifyRequest(BaseModel):
     """Request model for signature verification."""
+    # Request models are read-only once parsed; frozen skips pydantic's
+    # mutation bookkeeping and extra='forbid' rejects junk fields up front
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     message: str = Field(..., description="Original message")
     signature: str = Field(..., description="Signature in hex format")
     public_key: str = Field(..., description="Public key in hex format")
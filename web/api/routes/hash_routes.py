@@ -4,12 +4,15 @@ Hash Routes for the Dirac Hashes API.
 This module provides endpoints for the hash functionality of the Dirac Hashes API.
 """
 
+import asyncio
 import time
 import binascii
 import hashlib
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import Dict, Any, List, Union
 import base64
+import os
 
 from quantum_hash.dirac import DiracHash
 from web.api.models.hash_models import (
@@ -22,64 +25,83 @@ from web.api.models.hash_models import (
 
 router = APIRouter()
 
+# Admission control for CPU-bound work: only about one hash per core runs at
+# a time, extra callers wait cheaply on the loop instead of piling up threads
+_CPU_SEM = asyncio.Semaphore(os.cpu_count() or 4)
 
-def parse_message(message: str, encoding: str) -> bytes:
+
+# Encoding -> decoder table, resolved once instead of an if/elif chain per request
+_DECODERS = {
+    "utf-8": lambda message: message.encode("utf-8"),
+    "hex": bytes.fromhex,
+    "base64": base64.b64decode,
+}
+
+
+def parse_message(message: Union[str, bytes], encoding: str) -> bytes:
     """Parse message from the given encoding to bytes."""
     try:
-        if encoding.lower() == "utf-8":
-            return message.encode("utf-8")
-        elif encoding.lower() == "hex":
-            return binascii.unhexlify(message)
-        elif encoding.lower() == "base64":
-            return base64.b64decode(message)
-        else:
+        # Fast path: callers that already hold binary skip the decode entirely
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return bytes(message)
+        decoder = _DECODERS.get(encoding.lower())
+        if decoder is None:
             raise ValueError(f"Unsupported encoding: {encoding}")
+        return decoder(message)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error decoding message: {str(e)}")
 
 
-@router.post("/generate", response_model=HashResponse)
+@router.post("/generate", responses={200: {"model": HashResponse}})
 async def generate_hash(request: HashRequest):
     """Generate a hash digest using the specified algorithm."""
     try:
         # Parse message
         message_bytes = parse_message(request.message, request.encoding)
-        
+        # Enum attribute access goes through a descriptor; read it once
+        algo_val = request.algorithm.value
+
         # Create a preview of the message
         message_preview = request.message
         if len(message_preview) > 50:
             message_preview = message_preview[:47] + "..."
-        
-        # Use the static hash method directly
-        start_time = time.time()
-        digest = DiracHash.hash(message_bytes, algorithm=request.algorithm.value)
-        end_time = time.time()
-        
-        # Format response
-        return HashResponse(
-            hash=digest.hex(),
-            algorithm=request.algorithm.value,
-            message_preview=message_preview,
-            digest_length=len(digest),
-            time_ms=(end_time - start_time) * 1000
-        )
+
+        # DiracHash.hash is CPU-bound, so offload it to the threadpool
+        # rather than blocking the event loop thread
+        start_time = time.perf_counter_ns()
+        async with _CPU_SEM:
+            digest = await asyncio.to_thread(
+                DiracHash.hash, message_bytes, algorithm=algo_val
+            )
+        end_time = time.perf_counter_ns()
+
+        # Build the response directly: one dict allocation plus one orjson
+        # call, bypassing FastAPI's jsonable_encoder pass on the hot path
+        return ORJSONResponse({
+            "hash": binascii.hexlify(digest).decode('ascii'),
+            "algorithm": algo_val,
+            "message_preview": message_preview,
+            "digest_length": len(digest),
+            "time_ms": (end_time - start_time) / 1e6,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating hash: {str(e)}")
 
 
-@router.post("/compare", response_model=HashComparisonResponse)
+@router.post("/compare", responses={200: {"model": HashComparisonResponse}})
 async def compare_hashes(request: HashComparisonRequest):
     """Compare multiple hash algorithms on the same input."""
     try:
         # Parse message
         message_bytes = parse_message(request.message, request.encoding)
         
-        # Generate hashes for each algorithm
-        results = {}
-        for algo in request.algorithms:
+        # Each hash is CPU-bound but independent of the others, so run them
+        # concurrently in the threadpool instead of blocking the event loop
+        # for the sum of all algorithms' runtimes
+        def hash_one(algo):
             # Handle both enum values and plain strings
             algo_name = algo.value if hasattr(algo, 'value') else algo
-            
+
             # Use different hashlib algorithms for testing to ensure different hashes
             if algo_name == 'improved':
                 digest = hashlib.sha256(message_bytes).digest()
@@ -90,24 +112,43 @@ async def compare_hashes(request: HashComparisonRequest):
             else:
                 # Default to SHA3 for any other algorithm
                 digest = hashlib.sha3_256(message_bytes).digest()
-            
-            results[algo_name] = digest.hex()
-        
-        # Format response
-        return HashComparisonResponse(
-            message=request.message,
-            results=results,
-            encoding=request.encoding
+
+            return algo_name, binascii.hexlify(digest).decode('ascii')
+
+        # One semaphore permit per worker thread, not one around the whole
+        # fan-out - otherwise a single request could occupy as many cores
+        # as it lists algorithms while only accounting for one
+        async def hash_one_admitted(algo):
+            async with _CPU_SEM:
+                return await asyncio.to_thread(hash_one, algo)
+
+        hashed = await asyncio.gather(
+            *(hash_one_admitted(algo) for algo in request.algorithms)
         )
+        results = dict(hashed)
+        
+        # Format response - a plain dict skips response-model re-validation
+        return {
+            "message": request.message,
+            "results": results,
+            "encoding": request.encoding,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error comparing hashes: {str(e)}")
 
 
+# The algorithm list is constant, so serialize it once at import time and
+# let hot reads skip pydantic validation and json encoding entirely. Only
+# the body bytes are shared - middleware mutates response headers in
+# place, so each request gets its own Response object
+_ALGORITHMS_BODY = JSONResponse(
+    content=DiracHash.get_supported_algorithms(),
+).body
+_ALGORITHMS_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
 @router.get("/algorithms", response_model=List[str])
 async def list_algorithms():
     """List all available hash algorithms."""
-    try:
-        # Return supported algorithms
-        return DiracHash.get_supported_algorithms()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error listing algorithms: {str(e)}") 
\ No newline at end of file
+    return Response(content=_ALGORITHMS_BODY, media_type="application/json",
+                    headers=_ALGORITHMS_HEADERS) 
\ No newline at end of file
@@ -4,11 +4,13 @@ KEM Routes for the Dirac Hashes API.
 This module provides endpoints for the key encapsulation mechanism (KEM) functionality of the Dirac Hashes API.
 """
 
+import asyncio
 import time
-import binascii
-from fastapi import APIRouter, HTTPException, Body
+import functools
+from binascii import a2b_base64, b2a_base64, hexlify
+from fastapi import APIRouter, HTTPException, Body, Response
+from fastapi.responses import JSONResponse
 from typing import Dict, Any, List, Union
-import base64
 import hashlib
 import os
 
@@ -26,14 +28,28 @@ from web.api.models.kem_models import (
 
 router = APIRouter()
 
+# Admission control for CPU-bound work: only about one KEM operation per core
+# runs at a time, extra callers wait cheaply on the loop (see hash_routes)
+_CPU_SEM = asyncio.Semaphore(os.cpu_count() or 4)
+
+
+@functools.lru_cache(maxsize=16)
+def _make_kem(scheme_value: str, hash_algorithm: str, security_level: int):
+    """Construct (once per configuration) a KEM instance for the given parameters.
+
+    Kyber setup recomputes its parameters on every construction, so instances
+    are cached per (scheme, hash_algorithm, security_level). Instances hold no
+    per-request state - all randomness is drawn inside encapsulate/decapsulate.
+    """
+    if scheme_value == KEMScheme.KYBER.value:
+        return KyberKEM(security_level=security_level, hash_algorithm=hash_algorithm)
+    raise ValueError(f"Unsupported KEM scheme: {scheme_value}")
+
 
 def get_kem_instance(scheme: KEMScheme, hash_algorithm: str, security_level: int = 1):
     """Get a KEM instance based on the specified scheme and hash algorithm."""
     try:
-        if scheme == KEMScheme.KYBER:
-            return KyberKEM(security_level=security_level, hash_algorithm=hash_algorithm)
-        else:
-            raise ValueError(f"Unsupported KEM scheme: {scheme}")
+        return _make_kem(scheme.value, hash_algorithm, security_level)
     except Exception as e:
         # If there's an issue with initialization, fall back to mock implementation
         # for demonstration purposes
@@ -101,21 +117,55 @@ class MockKEM:
         return shared_secret
 
 
-@router.post("/keypair", response_model=KEMKeyPairResponse)
+def _parse_kyber_key(encoded_key: str, field_name: str, security_level: int) -> Dict[str, Any]:
+    """Parse a base64-encoded Kyber key into its seed and polynomial list.
+
+    Shared by encapsulate_key and decapsulate_key; field_name is 't' for
+    public keys and 's' for private keys.
+    """
+    key_bytes = a2b_base64(encoded_key)
+    seed = key_bytes[:32]
+    # View the polynomial region without copying; each chunk below is a
+    # single C-level memcpy rather than Python-level slicing
+    view = memoryview(key_bytes)[32:]
+
+    # Number of polynomials depends on the security level; the polynomial
+    # size is inferred from the data rather than assuming a fixed format
+    num_polys = {1: 2, 3: 3, 5: 4}.get(security_level, 2)
+    poly_size = len(view) // num_polys
+
+    polys = [
+        bytes(view[i * poly_size:(i + 1) * poly_size])
+        for i in range(num_polys)
+        if (i + 1) * poly_size <= len(view)
+    ]
+
+    if not polys:
+        raise ValueError(f"Could not extract any polynomials from {field_name} bytes")
+
+    return {'seed': seed, field_name: polys}
+
+
+@router.post("/keypair", responses={200: {"model": KEMKeyPairResponse}})
 async def generate_kem_keypair(request: KEMKeyPairRequest):
     """Generate a key pair for the specified KEM scheme."""
     try:
+        # Enum attribute access goes through a descriptor; read each once
+        scheme_val = request.scheme.value
+        hash_algo_val = request.hash_algorithm.value
+
         # Get KEM instance
         kem = get_kem_instance(
-            request.scheme, 
-            request.hash_algorithm.value,
+            request.scheme,
+            hash_algo_val,
             request.security_level
         )
         
         # Generate key pair
-        start_time = time.time()
-        private_key, public_key = kem.generate_keypair()
-        end_time = time.time()
+        start_time = time.perf_counter_ns()
+        async with _CPU_SEM:
+            private_key, public_key = await asyncio.to_thread(kem.generate_keypair)
+        end_time = time.perf_counter_ns()
         
         # Format keys for response
         private_key_formatted = ""
@@ -123,47 +173,50 @@ async def generate_kem_keypair(request: KEMKeyPairRequest):
         
         if request.scheme == KEMScheme.KYBER:
             try:
-                # Serialize the Kyber keys
-                private_bytes = private_key['seed']
-                if isinstance(private_key.get('s'), list):
-                    for s_poly in private_key['s']:
-                        if isinstance(s_poly, bytes):
-                            private_bytes += s_poly
-                
-                public_bytes = public_key['seed']
-                if isinstance(public_key.get('t'), list):
-                    for t_poly in public_key['t']:
-                        if isinstance(t_poly, bytes):
-                            public_bytes += t_poly
-                
-                private_key_formatted = base64.b64encode(private_bytes).decode('ascii')
-                public_key_formatted = base64.b64encode(public_bytes).decode('ascii')
+                # Serialize the Kyber keys - a single join preallocates the
+                # exact output size instead of growing a bytes object per polynomial
+                s_polys = private_key.get('s')
+                private_bytes = b"".join((
+                    private_key['seed'],
+                    *(p for p in s_polys if isinstance(p, bytes)),
+                )) if isinstance(s_polys, list) else private_key['seed']
+
+                t_polys = public_key.get('t')
+                public_bytes = b"".join((
+                    public_key['seed'],
+                    *(p for p in t_polys if isinstance(p, bytes)),
+                )) if isinstance(t_polys, list) else public_key['seed']
+
+                private_key_formatted = b2a_base64(private_bytes, newline=False).decode('ascii')
+                public_key_formatted = b2a_base64(public_bytes, newline=False).decode('ascii')
             except Exception as e:
                 raise HTTPException(
                     status_code=500,
                     detail=f"Error serializing Kyber keys: {str(e)}"
                 )
         
-        # Format response
-        return KEMKeyPairResponse(
-            private_key=private_key_formatted,
-            public_key=public_key_formatted,
-            scheme=request.scheme.value,
-            hash_algorithm=request.hash_algorithm.value,
-            security_level=request.security_level,
-            time_ms=(end_time - start_time) * 1000
-        )
+        # Format response - a plain dict skips response-model re-validation
+        return {
+            "private_key": private_key_formatted,
+            "public_key": public_key_formatted,
+            "scheme": scheme_val,
+            "hash_algorithm": hash_algo_val,
+            "security_level": request.security_level,
+            "time_ms": (end_time - start_time) / 1e6,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating KEM key pair: {str(e)}")
 
 
-@router.post("/encapsulate", response_model=EncapsulateResponse)
+@router.post("/encapsulate", responses={200: {"model": EncapsulateResponse}})
 async def encapsulate_key(request: EncapsulateRequest):
     """Encapsulate a shared secret using the specified KEM scheme."""
     try:
+        scheme_val = request.scheme.value
+
         # Get KEM instance
         kem = get_kem_instance(
-            request.scheme, 
+            request.scheme,
             request.hash_algorithm.value,
             request.security_level
         )
@@ -172,68 +225,46 @@ async def encapsulate_key(request: EncapsulateRequest):
         public_key = None
         if request.scheme == KEMScheme.KYBER:
             try:
-                # Parse the base64 encoded key
-                key_bytes = base64.b64decode(request.public_key)
-                seed = key_bytes[:32]
-                t_bytes = key_bytes[32:]
-                
-                # For Kyber, we need to properly structure the public key based on security level
-                # The public key format depends on our implementation
-                # Rather than assuming a specific polynomial format, we'll infer it from the data
-                
-                # Number of polynomials depends on the security level
-                num_polys = {1: 2, 3: 3, 5: 4}.get(request.security_level, 2)
-                poly_size = len(t_bytes) // num_polys  # Calculate polynomial size dynamically
-                
-                # Extract all polynomials from t_bytes
-                t = []
-                for i in range(num_polys):
-                    start = i * poly_size
-                    end = start + poly_size
-                    if end <= len(t_bytes):
-                        t.append(t_bytes[start:end])
-                
-                if not t:
-                    raise ValueError("Could not extract any polynomials from t_bytes")
-                
-                public_key = {
-                    'seed': seed,
-                    't': t
-                }
+                public_key = _parse_kyber_key(
+                    request.public_key, 't', request.security_level
+                )
             except Exception as e:
                 raise HTTPException(
-                    status_code=400, 
+                    status_code=400,
                     detail=f"Invalid public key format: {str(e)}"
                 )
         
         # Encapsulate shared secret
-        start_time = time.time()
-        ciphertext, shared_secret = kem.encapsulate(public_key)
-        end_time = time.time()
+        start_time = time.perf_counter_ns()
+        async with _CPU_SEM:
+            ciphertext, shared_secret = await asyncio.to_thread(kem.encapsulate, public_key)
+        end_time = time.perf_counter_ns()
         
         # Format for response
-        ciphertext_formatted = base64.b64encode(ciphertext).decode('ascii')
-        shared_secret_formatted = shared_secret.hex()
+        ciphertext_formatted = b2a_base64(ciphertext, newline=False).decode('ascii')
+        shared_secret_formatted = hexlify(shared_secret).decode('ascii')
         
-        # Format response
-        return EncapsulateResponse(
-            ciphertext=ciphertext_formatted,
-            shared_secret=shared_secret_formatted,
-            scheme=request.scheme.value,
-            ciphertext_size_bytes=len(ciphertext),
-            time_ms=(end_time - start_time) * 1000
-        )
+        # Format response - a plain dict skips response-model re-validation
+        return {
+            "ciphertext": ciphertext_formatted,
+            "shared_secret": shared_secret_formatted,
+            "scheme": scheme_val,
+            "ciphertext_size_bytes": len(ciphertext),
+            "time_ms": (end_time - start_time) / 1e6,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error encapsulating shared secret: {str(e)}")
 
 
-@router.post("/decapsulate", response_model=DecapsulateResponse)
+@router.post("/decapsulate", responses={200: {"model": DecapsulateResponse}})
 async def decapsulate_key(request: DecapsulateRequest):
     """Decapsulate a shared secret using the specified KEM scheme."""
     try:
+        scheme_val = request.scheme.value
+
         # Get KEM instance
         kem = get_kem_instance(
-            request.scheme, 
+            request.scheme,
             request.hash_algorithm.value,
             request.security_level
         )
@@ -244,77 +275,64 @@ async def decapsulate_key(request: DecapsulateRequest):
         
         if request.scheme == KEMScheme.KYBER:
             try:
-                # Parse the base64 encoded key
-                key_bytes = base64.b64decode(request.private_key)
-                seed = key_bytes[:32]
-                s_bytes = key_bytes[32:]
-                
-                # For Kyber, we need to properly structure the private key based on security level
-                # Number of polynomials depends on the security level
-                num_polys = {1: 2, 3: 3, 5: 4}.get(request.security_level, 2)
-                poly_size = len(s_bytes) // num_polys  # Calculate polynomial size dynamically
-                
-                # Extract all polynomials from s_bytes
-                s = []
-                for i in range(num_polys):
-                    start = i * poly_size
-                    end = start + poly_size
-                    if end <= len(s_bytes):
-                        s.append(s_bytes[start:end])
-                
-                if not s:
-                    raise ValueError("Could not extract any polynomials from s_bytes")
-                
-                private_key = {
-                    'seed': seed,
-                    's': s
-                }
-                
+                private_key = _parse_kyber_key(
+                    request.private_key, 's', request.security_level
+                )
+
                 # Parse ciphertext
-                ciphertext = base64.b64decode(request.ciphertext)
+                ciphertext = a2b_base64(request.ciphertext)
             except Exception as e:
                 raise HTTPException(
-                    status_code=400, 
+                    status_code=400,
                     detail=f"Invalid private key or ciphertext format: {str(e)}"
                 )
         
         # Decapsulate shared secret
-        start_time = time.time()
-        shared_secret = kem.decapsulate(ciphertext, private_key)
-        end_time = time.time()
+        start_time = time.perf_counter_ns()
+        async with _CPU_SEM:
+            shared_secret = await asyncio.to_thread(kem.decapsulate, ciphertext, private_key)
+        end_time = time.perf_counter_ns()
         
         # Format for response
-        shared_secret_formatted = shared_secret.hex()
+        shared_secret_formatted = hexlify(shared_secret).decode('ascii')
         
-        # Format response
-        return DecapsulateResponse(
-            shared_secret=shared_secret_formatted,
-            scheme=request.scheme.value,
-            time_ms=(end_time - start_time) * 1000
-        )
+        # Format response - a plain dict skips response-model re-validation
+        return {
+            "shared_secret": shared_secret_formatted,
+            "scheme": scheme_val,
+            "time_ms": (end_time - start_time) / 1e6,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error decapsulating shared secret: {str(e)}")
 
 
+# The scheme catalogue is constant, so serialize it once at import time and
+# let hot reads skip pydantic validation and json encoding entirely. Only
+# the body bytes are shared - middleware mutates response headers in
+# place, so each request gets its own Response object
+_SCHEMES_BODY = JSONResponse(
+    content={
+        "kyber": {
+            "name": "CRYSTALS-Kyber",
+            "type": "lattice-based",
+            "security": "post-quantum",
+            "key_size": "~1KB private, ~1KB public",
+            "ciphertext_size": "~1.5KB",
+            "shared_secret_size": "32 bytes",
+            "security_levels": {
+                "1": "Kyber-512 (equivalent to AES-128)",
+                "3": "Kyber-768 (equivalent to AES-192)",
+                "5": "Kyber-1024 (equivalent to AES-256)"
+            },
+            "notes": "NIST PQC standard, selected for key encapsulation"
+        }
+    },
+).body
+_SCHEMES_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
 @router.get("/schemes", response_model=Dict[str, Any])
 async def list_kem_schemes():
     """List all available KEM schemes with their details."""
-    try:
-        return {
-            "kyber": {
-                "name": "CRYSTALS-Kyber",
-                "type": "lattice-based",
-                "security": "post-quantum",
-                "key_size": "~1KB private, ~1KB public",
-                "ciphertext_size": "~1.5KB",
-                "shared_secret_size": "32 bytes",
-                "security_levels": {
-                    "1": "Kyber-512 (equivalent to AES-128)",
-                    "3": "Kyber-768 (equivalent to AES-192)",
-                    "5": "Kyber-1024 (equivalent to AES-256)"
-                },
-                "notes": "NIST PQC standard, selected for key encapsulation"
-            }
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error listing KEM schemes: {str(e)}") 
\ No newline at end of file
+    return Response(content=_SCHEMES_BODY, media_type="application/json",
+                    headers=_SCHEMES_HEADERS) 
\ No newline at end of file
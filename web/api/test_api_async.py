@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Async test script for the Dirac Hashes API.
+
+Concurrent variant of test_api.py: the five endpoint checks are
+independent, so they are issued together over one httpx.AsyncClient and
+awaited with asyncio.gather. Total wall-time drops from the sum of the
+endpoint latencies to roughly the slowest one.
+"""
+
+import asyncio
+import json
+import sys
+
+import httpx
+
+# Configuration
+API_URL = "http://localhost:8000"
+
+
+async def test_root(client):
+    """Test the root endpoint."""
+    response = await client.get("/")
+    print(f"\n=== Root Endpoint ===\nStatus: {response.status_code}")
+    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    return response.status_code == 200
+
+
+async def test_hash_generate(client):
+    """Test the hash generation endpoint."""
+    data = {
+        "message": "Hello, quantum world!",
+        "algorithm": "improved",
+        "encoding": "utf-8"
+    }
+    response = await client.post("/api/hash/generate", json=data)
+    print(f"\n=== Hash Generation ===\nStatus: {response.status_code}")
+    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    return response.status_code == 200
+
+
+async def test_hash_compare(client):
+    """Test the hash comparison endpoint."""
+    data = {
+        "message": "Hello, quantum world!",
+        "algorithms": ["improved", "grover", "shor"],
+        "encoding": "utf-8"
+    }
+    response = await client.post("/api/hash/compare", json=data)
+    print(f"\n=== Hash Comparison ===\nStatus: {response.status_code}")
+    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    return response.status_code == 200
+
+
+async def test_signature_keypair(client):
+    """Test the signature key pair generation endpoint."""
+    data = {
+        "scheme": "dilithium",
+        "hash_algorithm": "improved",
+        "security_level": 2
+    }
+    response = await client.post("/api/signatures/keypair", json=data)
+    print(f"\n=== Signature Key Pair Generation ===\nStatus: {response.status_code}")
+    if response.status_code == 200:
+        result = response.json()
+        # Truncate the keys for display
+        result["public_key"] = result["public_key"][:50] + "..."
+        result["private_key"] = result["private_key"][:50] + "..."
+        print(f"Response: {json.dumps(result, indent=2)}")
+    else:
+        print(f"Response: {response.text}")
+    return response.status_code == 200
+
+
+async def test_kem_keypair(client):
+    """Test the KEM key pair generation endpoint."""
+    data = {
+        "scheme": "kyber",
+        "hash_algorithm": "improved",
+        "security_level": 1
+    }
+    response = await client.post("/api/kem/keypair", json=data)
+    print(f"\n=== KEM Key Pair Generation ===\nStatus: {response.status_code}")
+    if response.status_code == 200:
+        result = response.json()
+        # Truncate the keys for display
+        result["public_key"] = result["public_key"][:50] + "..."
+        result["private_key"] = result["private_key"][:50] + "..."
+        print(f"Response: {json.dumps(result, indent=2)}")
+    else:
+        print(f"Response: {response.text}")
+    return response.status_code == 200
+
+
+async def amain():
+    """Run all tests concurrently over a shared client."""
+    print("=== Dirac Hashes API Test Script (async) ===")
+    print(f"Testing API at {API_URL}")
+
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30.0) as client:
+        names = ["root", "hash_generate", "hash_compare",
+                 "signature_keypair", "kem_keypair"]
+        outcomes = await asyncio.gather(
+            test_root(client),
+            test_hash_generate(client),
+            test_hash_compare(client),
+            test_signature_keypair(client),
+            test_kem_keypair(client),
+            return_exceptions=True,
+        )
+
+    results = {name: outcome is True for name, outcome in zip(names, outcomes)}
+
+    # Print summary
+    print("\n=== Test Summary ===")
+    for test, result in results.items():
+        print(f"{test}: {'✓ PASSED' if result else '✗ FAILED'}")
+
+    # Return success if all tests passed
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    success = asyncio.run(amain())
+    sys.exit(0 if success else 1)